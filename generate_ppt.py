@@ -4,17 +4,21 @@ MailMind — AlgoQuest 2025 Round 2 Presentation Generator
 Team Cipher | AI-Powered Smart Email Assistant
 
 Generates: mailmindd/MailMind_AlgoQuest_R2.pptx
-Run:       python mailmindd/generate_ppt.py
+Run:       python mailmindd/generate_ppt.py [-o out.pptx] [--no-lint] [--lint-warnings]
+                                            [--svg DIR] [--trace PATH] [--trace-sample RATE]
 Requires:  pip install python-pptx
 """
 
 import os
+import sys
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 
+from ppt_trace import trace_span, traced
+
 # ──────────────────────────────────────────────────────────────
 # COLOUR PALETTE
 # ──────────────────────────────────────────────────────────────
@@ -34,10 +38,21 @@ CARD_BG_LIGHT   = RGBColor(51, 65, 85)       # #334155
 SLIDE_W = Inches(13.333)
 SLIDE_H = Inches(7.5)
 FONT    = "Calibri"
+FOOTER_TEXT   = "Team Cipher  |  AlgoQuest 2025"
+TITLE_TEXT    = "\U0001f9e0  MailMind"                              # 🧠
+SUBTITLE_TEXT = "AI-Powered Smart Email Assistant"
+TEAM_TEXT     = "Team Cipher  |  AlgoQuest 2025 — Round 2"
 
 # ──────────────────────────────────────────────────────────────
 # HELPER FUNCTIONS
 # ──────────────────────────────────────────────────────────────
+# Shape helpers only trace their python-pptx branch, so recording a
+# shape into ppt_ir never touches ppt_trace.
+
+def _recording(slide):
+    """True when *slide* is a ppt_ir recorder rather than a python-pptx slide."""
+    return getattr(slide, "is_recording", False)
+
 
 def _no_border(shape):
     """Remove the outline / border from a shape."""
@@ -46,36 +61,49 @@ def _no_border(shape):
 
 def add_background(slide):
     """Fill the entire slide with the dark navy background."""
-    fill = slide.background.fill
-    fill.solid()
-    fill.fore_color.rgb = BG_COLOR
+    if _recording(slide):
+        return slide.record_background(BG_COLOR)
+    with trace_span("add_background"):
+        fill = slide.background.fill
+        fill.solid()
+        fill.fore_color.rgb = BG_COLOR
 
 
 def add_accent_bar(slide, color=ELECTRIC_BLUE, height=Inches(0.08)):
     """Add a thin coloured bar across the very top of the slide."""
-    bar = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE, Inches(0), Inches(0), SLIDE_W, height
-    )
-    bar.fill.solid()
-    bar.fill.fore_color.rgb = color
-    _no_border(bar)
-    return bar
-
-
-def add_footer(slide, text="Team Cipher  |  AlgoQuest 2025"):
-    """Add a small grey footer at the bottom-right."""
-    tb = slide.shapes.add_textbox(
-        Inches(8.5), Inches(7.05), Inches(4.5), Inches(0.35)
-    )
-    tf = tb.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(10)
-    p.font.color.rgb = MID_GRAY
-    p.font.name = FONT
-    p.alignment = PP_ALIGN.RIGHT
-    _no_border(tb)
+    if _recording(slide):
+        return slide.record_shape("rect", Inches(0), Inches(0), SLIDE_W, height, color)
+    with trace_span("add_accent_bar"):
+        bar = slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(0), Inches(0), SLIDE_W, height
+        )
+        bar.fill.solid()
+        bar.fill.fore_color.rgb = color
+        _no_border(bar)
+        return bar
+
+
+def add_footer(slide, text=None):
+    """Add a small grey footer at the bottom-right (FOOTER_TEXT by default)."""
+    if text is None:
+        text = FOOTER_TEXT
+    if _recording(slide):
+        return slide.record_text(Inches(8.5), Inches(7.05), Inches(4.5), Inches(0.35),
+                                 text, Pt(10), MID_GRAY, None, PP_ALIGN.RIGHT,
+                                 FONT, True)
+    with trace_span("add_footer"):
+        tb = slide.shapes.add_textbox(
+            Inches(8.5), Inches(7.05), Inches(4.5), Inches(0.35)
+        )
+        tf = tb.text_frame
+        tf.word_wrap = True
+        p = tf.paragraphs[0]
+        p.text = text
+        p.font.size = Pt(10)
+        p.font.color.rgb = MID_GRAY
+        p.font.name = FONT
+        p.alignment = PP_ALIGN.RIGHT
+        _no_border(tb)
 
 
 def add_text_box(slide, left, top, width, height, text,
@@ -83,31 +111,41 @@ def add_text_box(slide, left, top, width, height, text,
                  alignment=PP_ALIGN.LEFT, font_name=FONT,
                  word_wrap=True):
     """Convenience: add a simple single-paragraph text box."""
-    tb = slide.shapes.add_textbox(
-        Inches(left), Inches(top), Inches(width), Inches(height)
-    )
-    tf = tb.text_frame
-    tf.word_wrap = word_wrap
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = font_size
-    p.font.color.rgb = color
-    p.font.bold = bold
-    p.font.name = font_name
-    p.alignment = alignment
-    _no_border(tb)
-    return tb
+    if _recording(slide):
+        return slide.record_text(Inches(left), Inches(top), Inches(width), Inches(height),
+                                 text, font_size, color, bold, alignment,
+                                 font_name, word_wrap)
+    with trace_span("add_text_box"):
+        tb = slide.shapes.add_textbox(
+            Inches(left), Inches(top), Inches(width), Inches(height)
+        )
+        tf = tb.text_frame
+        tf.word_wrap = word_wrap
+        p = tf.paragraphs[0]
+        p.text = text
+        p.font.size = font_size
+        p.font.color.rgb = color
+        p.font.bold = bold
+        p.font.name = font_name
+        p.alignment = alignment
+        _no_border(tb)
+        return tb
 
 
 def add_rich_text_box(slide, left, top, width, height):
     """Return (text_frame, textbox) so caller can add multiple paragraphs."""
-    tb = slide.shapes.add_textbox(
-        Inches(left), Inches(top), Inches(width), Inches(height)
-    )
-    tf = tb.text_frame
-    tf.word_wrap = True
-    _no_border(tb)
-    return tf, tb
+    if _recording(slide):
+        # ppt_ir rows hold one paragraph; callers edit the returned frame directly
+        raise TypeError("add_rich_text_box() cannot record into ppt_ir; "
+                        "use one add_text_box() per paragraph")
+    with trace_span("add_rich_text_box"):
+        tb = slide.shapes.add_textbox(
+            Inches(left), Inches(top), Inches(width), Inches(height)
+        )
+        tf = tb.text_frame
+        tf.word_wrap = True
+        _no_border(tb)
+        return tf, tb
 
 
 def _add_run(paragraph, text, size=Pt(18), color=WHITE, bold=False, name=FONT):
@@ -137,68 +175,80 @@ def _add_paragraph(tf, text="", size=Pt(18), color=WHITE, bold=False,
 
 def add_card(slide, left, top, width, height, fill_color=CARD_BG):
     """Add a filled rounded-look rectangle (card) and return the shape."""
-    card = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE, Inches(left), Inches(top),
-        Inches(width), Inches(height)
-    )
-    card.fill.solid()
-    card.fill.fore_color.rgb = fill_color
-    _no_border(card)
-    return card
+    if _recording(slide):
+        return slide.record_shape("card", Inches(left), Inches(top),
+                                  Inches(width), Inches(height), fill_color)
+    with trace_span("add_card"):
+        card = slide.shapes.add_shape(
+            MSO_SHAPE.ROUNDED_RECTANGLE, Inches(left), Inches(top),
+            Inches(width), Inches(height)
+        )
+        card.fill.solid()
+        card.fill.fore_color.rgb = fill_color
+        _no_border(card)
+        return card
 
 
 def add_rect(slide, left, top, width, height, fill_color=ELECTRIC_BLUE):
     """Add a plain rectangle shape."""
-    r = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE, Inches(left), Inches(top),
-        Inches(width), Inches(height)
-    )
-    r.fill.solid()
-    r.fill.fore_color.rgb = fill_color
-    _no_border(r)
-    return r
+    if _recording(slide):
+        return slide.record_shape("rect", Inches(left), Inches(top),
+                                  Inches(width), Inches(height), fill_color)
+    with trace_span("add_rect"):
+        r = slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(left), Inches(top),
+            Inches(width), Inches(height)
+        )
+        r.fill.solid()
+        r.fill.fore_color.rgb = fill_color
+        _no_border(r)
+        return r
 
 
 def add_slide_title(slide, title, subtitle=None):
     """Add a large title (and optional subtitle) near the top of the slide."""
-    add_text_box(slide, 0.8, 0.35, 11.5, 0.7, title,
-                 font_size=Pt(38), color=WHITE, bold=True,
-                 alignment=PP_ALIGN.LEFT)
-    if subtitle:
-        add_text_box(slide, 0.8, 1.0, 11.5, 0.5, subtitle,
-                     font_size=Pt(18), color=LIGHT_GRAY, bold=False,
+    with trace_span("add_slide_title"):
+        add_text_box(slide, 0.8, 0.35, 11.5, 0.7, title,
+                     font_size=Pt(38), color=WHITE, bold=True,
                      alignment=PP_ALIGN.LEFT)
+        if subtitle:
+            add_text_box(slide, 0.8, 1.0, 11.5, 0.5, subtitle,
+                         font_size=Pt(18), color=LIGHT_GRAY, bold=False,
+                         alignment=PP_ALIGN.LEFT)
 
 
-def new_slide(prs):
+def new_slide(prs, footer=None):
     """Create a blank slide with background, accent bar and footer."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_background(slide)
-    add_accent_bar(slide)
-    add_footer(slide)
-    return slide
+    with trace_span("new_slide"):
+        if _recording(prs):
+            slide = prs.add_slide()
+        else:
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+        add_background(slide)
+        add_accent_bar(slide)
+        add_footer(slide, footer)
+        return slide
 
 
 # ──────────────────────────────────────────────────────────────
 # SLIDE BUILDERS
 # ──────────────────────────────────────────────────────────────
 
-def slide_01_title(prs):
+def slide_01_title(prs, title=TITLE_TEXT, subtitle=SUBTITLE_TEXT, team=TEAM_TEXT,
+                   footer=None):
     """Title slide."""
-    slide = new_slide(prs)
+    slide = new_slide(prs, footer)
 
     # Decorative accent line in centre
     add_rect(slide, 4.5, 1.2, 4.3, 0.06, ELECTRIC_BLUE)
 
     # Main title
-    add_text_box(slide, 1, 1.5, 11.3, 1.0,
-                 "\U0001f9e0  MailMind",                 # 🧠
+    add_text_box(slide, 1, 1.5, 11.3, 1.0, title,
                  font_size=Pt(54), color=WHITE, bold=True,
                  alignment=PP_ALIGN.CENTER)
 
     # Subtitle
-    add_text_box(slide, 1, 2.6, 11.3, 0.6,
-                 "AI-Powered Smart Email Assistant",
+    add_text_box(slide, 1, 2.6, 11.3, 0.6, subtitle,
                  font_size=Pt(28), color=ELECTRIC_BLUE, bold=False,
                  alignment=PP_ALIGN.CENTER)
 
@@ -209,8 +259,7 @@ def slide_01_title(prs):
                  alignment=PP_ALIGN.CENTER)
 
     # Team
-    add_text_box(slide, 1, 4.1, 11.3, 0.5,
-                 "Team Cipher  |  AlgoQuest 2025 — Round 2",
+    add_text_box(slide, 1, 4.1, 11.3, 0.5, team,
                  font_size=Pt(20), color=WHITE, bold=True,
                  alignment=PP_ALIGN.CENTER)
 
@@ -224,9 +273,9 @@ def slide_01_title(prs):
                  alignment=PP_ALIGN.CENTER)
 
 
-def slide_02_problem(prs):
+def slide_02_problem(prs, footer=None):
     """The Problem: Email Overload."""
-    slide = new_slide(prs)
+    slide = new_slide(prs, footer)
     add_slide_title(slide, "The Problem: Email Overload",
                     "Professionals are drowning — and current tools aren't helping.")
 
@@ -258,9 +307,9 @@ def slide_02_problem(prs):
                      alignment=PP_ALIGN.CENTER)
 
 
-def slide_03_solution(prs):
+def slide_03_solution(prs, footer=None):
     """Our Solution: MailMind."""
-    slide = new_slide(prs)
+    slide = new_slide(prs, footer)
     add_slide_title(slide, "Our Solution: MailMind")
 
     # One-liner
@@ -299,9 +348,9 @@ def slide_03_solution(prs):
                      alignment=PP_ALIGN.LEFT)
 
 
-def slide_04_mapping(prs):
+def slide_04_mapping(prs, footer=None):
     """Problem Statement → Our Implementation."""
-    slide = new_slide(prs)
+    slide = new_slide(prs, footer)
     add_slide_title(slide, "Problem Statement → Our Implementation",
                     "Every requirement mapped to a concrete feature.")
 
@@ -317,7 +366,7 @@ def slide_04_mapping(prs):
     ]
 
     y_start = 1.7
-    row_h = 0.62
+    row_h = 0.58
 
     # Header
     add_rect(slide, 0.6, y_start, 5.4, row_h, CARD_BG_LIGHT)
@@ -332,10 +381,9 @@ def slide_04_mapping(prs):
         y = y_start + (idx + 1) * row_h
         bg = CARD_BG if idx % 2 == 0 else RGBColor(22, 33, 50)
 
-        # Left cell
-        add_rect(slide, 0.6, y, 5.4, row_h, bg)
-        # Color dot
+        # Color dot, then the left cell beside it
         add_rect(slide, 0.6, y, 0.08, row_h, color)
+        add_rect(slide, 0.68, y, 5.32, row_h, bg)
         add_text_box(slide, 0.85, y + 0.1, 5.0, 0.4, req,
                      font_size=Pt(15), color=WHITE, bold=True)
 
@@ -345,9 +393,9 @@ def slide_04_mapping(prs):
                      font_size=Pt(15), color=LIGHT_GRAY)
 
 
-def slide_05_architecture(prs):
+def slide_05_architecture(prs, footer=None):
     """System Architecture."""
-    slide = new_slide(prs)
+    slide = new_slide(prs, footer)
     add_slide_title(slide, "System Architecture",
                     "Clean, serverless, AI-first design.")
 
@@ -416,9 +464,9 @@ def slide_05_architecture(prs):
                  alignment=PP_ALIGN.CENTER)
 
 
-def slide_06_core_features(prs):
+def slide_06_core_features(prs, footer=None):
     """Core AI Features."""
-    slide = new_slide(prs)
+    slide = new_slide(prs, footer)
     add_slide_title(slide, "Core AI Features",
                     "Intelligent email processing powered by Groq Llama 3.3 70B.")
 
@@ -452,9 +500,9 @@ def slide_06_core_features(prs):
                      font_size=Pt(15), color=LIGHT_GRAY)
 
 
-def slide_07_nlp_rag(prs):
+def slide_07_nlp_rag(prs, footer=None):
     """NLP & RAG-Powered Intelligence."""
-    slide = new_slide(prs)
+    slide = new_slide(prs, footer)
     add_slide_title(slide, "NLP & RAG-Powered Intelligence",
                     "Deep language understanding meets retrieval-augmented generation.")
 
@@ -504,9 +552,9 @@ def slide_07_nlp_rag(prs):
         y += 0.85
 
 
-def slide_08_agentic(prs):
+def slide_08_agentic(prs, footer=None):
     """Agentic AI: One-Click Email Handling."""
-    slide = new_slide(prs)
+    slide = new_slide(prs, footer)
     add_slide_title(slide, "Agentic AI: One-Click Email Handling",
                     "The AI handles everything — autonomously, step by step.")
 
@@ -555,9 +603,9 @@ def slide_08_agentic(prs):
                  font_size=Pt(16), color=TEAL, alignment=PP_ALIGN.CENTER)
 
 
-def slide_09_productivity(prs):
+def slide_09_productivity(prs, footer=None):
     """Productivity & Collaboration Suite."""
-    slide = new_slide(prs)
+    slide = new_slide(prs, footer)
     add_slide_title(slide, "Productivity & Collaboration Suite",
                     "Beyond email — a complete workflow platform.")
 
@@ -591,9 +639,9 @@ def slide_09_productivity(prs):
                      font_size=Pt(15), color=LIGHT_GRAY)
 
 
-def slide_10_testing(prs):
+def slide_10_testing(prs, footer=None):
     """Innovation: LLM-as-Test-Oracle."""
-    slide = new_slide(prs)
+    slide = new_slide(prs, footer)
     add_slide_title(slide, "Innovation: LLM-as-Test-Oracle",
                     "How do you test if AI output is reasonable?  You ask another LLM.")
 
@@ -639,25 +687,25 @@ def slide_10_testing(prs):
         ("ai-reply-quality.test.ts",       "Validates reply professionalism & tone",   PURPLE),
     ]
 
-    y = 4.0
+    y = 3.95
     for name, desc, color in suites:
-        add_rect(slide, 0.8, y, 0.08, 0.55, color)
-        add_card(slide, 0.95, y, 11.5, 0.55, CARD_BG)
-        add_text_box(slide, 1.1, y + 0.08, 4.5, 0.4, name,
+        add_rect(slide, 0.8, y, 0.08, 0.5, color)
+        add_card(slide, 0.95, y, 11.5, 0.5, CARD_BG)
+        add_text_box(slide, 1.1, y + 0.05, 4.5, 0.4, name,
                      font_size=Pt(15), color=color, bold=True)
-        add_text_box(slide, 5.8, y + 0.08, 6.0, 0.4, desc,
+        add_text_box(slide, 5.8, y + 0.05, 6.0, 0.4, desc,
                      font_size=Pt(15), color=LIGHT_GRAY)
-        y += 0.65
+        y += 0.56
 
     # Bottom note
-    add_text_box(slide, 0.8, 7.0 - 0.6, 11.5, 0.4,
+    add_text_box(slide, 0.8, 6.7, 11.5, 0.35,
                  "Powered by Vitest  +  Groq Llama 3.3 70B Versatile",
                  font_size=Pt(14), color=TEAL, alignment=PP_ALIGN.CENTER)
 
 
-def slide_11_scalability(prs):
+def slide_11_scalability(prs, footer=None):
     """Real-World Ready."""
-    slide = new_slide(prs)
+    slide = new_slide(prs, footer)
     add_slide_title(slide, "Real-World Ready",
                     "Built for production from day one.")
 
@@ -691,19 +739,19 @@ def slide_11_scalability(prs):
         ("Real Gmail OAuth",         "Production-ready NextAuth integration",             GREEN),
     ]
 
-    y = 4.9
+    y = 4.75
     for title, desc, color in points:
         add_rect(slide, 0.8, y, 0.08, 0.5, color)
         add_text_box(slide, 1.1, y + 0.05, 4.0, 0.4, title,
                      font_size=Pt(17), color=WHITE, bold=True)
         add_text_box(slide, 5.3, y + 0.05, 7.2, 0.4, desc,
                      font_size=Pt(15), color=LIGHT_GRAY)
-        y += 0.6
+        y += 0.55
 
 
-def slide_12_thanks(prs):
+def slide_12_thanks(prs, footer=None):
     """Thank You + Live Demo."""
-    slide = new_slide(prs)
+    slide = new_slide(prs, footer)
 
     # Decorative centre line
     add_rect(slide, 4.5, 1.0, 4.3, 0.06, ELECTRIC_BLUE)
@@ -753,31 +801,94 @@ def slide_12_thanks(prs):
 # MAIN
 # ──────────────────────────────────────────────────────────────
 
-def generate():
+SLIDE_BUILDERS = (
+    slide_01_title,
+    slide_02_problem,
+    slide_03_solution,
+    slide_04_mapping,
+    slide_05_architecture,
+    slide_06_core_features,
+    slide_07_nlp_rag,
+    slide_08_agentic,
+    slide_09_productivity,
+    slide_10_testing,
+    slide_11_scalability,
+    slide_12_thanks,
+)
+
+
+def build_presentation():
+    """Run every slide builder and return the in-memory Presentation."""
     prs = Presentation()
     prs.slide_width  = SLIDE_W
     prs.slide_height = SLIDE_H
 
-    slide_01_title(prs)
-    slide_02_problem(prs)
-    slide_03_solution(prs)
-    slide_04_mapping(prs)
-    slide_05_architecture(prs)
-    slide_06_core_features(prs)
-    slide_07_nlp_rag(prs)
-    slide_08_agentic(prs)
-    slide_09_productivity(prs)
-    slide_10_testing(prs)
-    slide_11_scalability(prs)
-    slide_12_thanks(prs)
+    for builder in SLIDE_BUILDERS:
+        with trace_span(builder.__name__) as span:
+            builder(prs)
+            if span is not None:
+                span["shapes"] = len(prs.slides[len(prs.slides) - 1].shapes)
+    return prs
+
+
+@traced
+def generate(out_path=None, lint=True, svg_dir=None, lint_warnings=False):
+    """Build, lint and save the deck (plus an SVG preview when *svg_dir* is set).
+
+    Exits non-zero on layout errors; warnings are only printed with *lint_warnings*.
+    """
+    prs = build_presentation()
+
+    if lint:
+        from ppt_lint import lint_presentation, report
+        n_errors = report(lint_presentation(prs, BG_COLOR), warnings=lint_warnings)
+        if n_errors:
+            raise SystemExit("[FAIL] Layout lint found {} error(s)".format(n_errors))
 
     # Determine output path relative to this script's directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    out_path = os.path.join(script_dir, "MailMind_AlgoQuest_R2.pptx")
-    prs.save(out_path)
+    if out_path is None:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        out_path = os.path.join(script_dir, "MailMind_AlgoQuest_R2.pptx")
+    with trace_span("prs.save") as span:
+        prs.save(out_path)
+        if span is not None:
+            span["bytes"] = os.path.getsize(out_path)
     print("[OK] Presentation saved -> {}".format(out_path))
     print("     Slides: {}".format(len(prs.slides)))
 
+    if svg_dir:
+        from ppt_svg import export_svg
+        export_svg(svg_dir)
+        print("[OK] SVG preview saved -> {}".format(svg_dir))
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the MailMind deck.")
+    parser.add_argument("-o", "--out", help="output .pptx path")
+    parser.add_argument("--no-lint", action="store_true",
+                        help="skip the layout lint pass")
+    parser.add_argument("--lint-warnings", action="store_true",
+                        help="also print layout lint warnings")
+    parser.add_argument("--svg", metavar="DIR",
+                        help="also write an HTML/SVG preview into DIR")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="append build spans to PATH (.json = Chrome trace, else JSON lines)")
+    parser.add_argument("--trace-sample", type=float, default=1.0, metavar="RATE",
+                        help="fraction of builds to trace (default: 1.0)")
+    args = parser.parse_args(argv)
+    options = dict(out_path=args.out, lint=not args.no_lint, svg_dir=args.svg,
+                   lint_warnings=args.lint_warnings)
+    if args.trace:
+        from ppt_trace import traced_generate
+        tracer = traced_generate(sys.modules[__name__], args.trace,
+                                 sample_rate=args.trace_sample, **options)
+        if tracer.sampled:
+            print("[OK] Trace {} appended -> {}".format(tracer.trace_id, args.trace))
+    else:
+        generate(**options)
+
 
 if __name__ == "__main__":
-    generate()
+    main()
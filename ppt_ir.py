@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+MailMind — Columnar Shape IR
+Team Cipher | AI-Powered Smart Email Assistant
+
+An in-memory intermediate representation for decks.  The existing
+slide_NN_* builders record into it instead of creating python-pptx
+proxies and lxml nodes (every drawing helper but add_rich_text_box has
+a recording form); each shape is one row across a handful of
+array-backed columns:
+
+    kind   slide   x   y   w   h   fill   text   style
+    'B'    'I'    'q' 'q' 'q' 'q'  'H'    'I'    'H'
+
+Colours, strings and text styles are interned, so a row costs ~45
+bytes no matter how long its text is, and recolouring a whole deck is
+a palette edit.  XML is only produced by IRDeck.save().
+
+Run:       python mailmindd/ppt_ir.py [--shapes N]   (benchmark)
+Requires:  pip install python-pptx   (numpy optional, for as_numpy())
+"""
+
+import sys
+import time
+from array import array
+from collections import namedtuple
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE
+
+import generate_ppt as gp
+
+# ──────────────────────────────────────────────────────────────
+# ROW LAYOUT
+# ──────────────────────────────────────────────────────────────
+KIND_BACKGROUND = 0
+KIND_RECT = 1
+KIND_CARD = 2
+KIND_TEXT = 3
+
+_KIND_BY_NAME = {"rect": KIND_RECT, "card": KIND_CARD}
+_AUTO_SHAPE = {KIND_RECT: MSO_SHAPE.RECTANGLE,
+               KIND_CARD: MSO_SHAPE.ROUNDED_RECTANGLE}
+
+NO_FILL = 0xFFFF
+NO_TEXT = 0
+NO_STYLE = 0
+
+Row = namedtuple("Row", "kind slide x y w h fill text style")
+TextStyle = namedtuple("TextStyle", "font_size color bold alignment font_name word_wrap")
+
+
+class Interner(object):
+    """Append-only table mapping hashable values to dense integer ids."""
+
+    def __init__(self, seed=()):
+        self.values = []
+        self._ids = {}
+        for value in seed:
+            self.intern(value)
+
+    def intern(self, value):
+        idx = self._ids.get(value)
+        if idx is None:
+            idx = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+    def __getitem__(self, idx):
+        return self.values[idx]
+
+    def __len__(self):
+        return len(self.values)
+
+    def copy(self):
+        """Independent copy with the same ids (values may repeat after a recolour)."""
+        out = Interner()
+        out.values = list(self.values)
+        out._ids = dict(self._ids)
+        return out
+
+
+# ──────────────────────────────────────────────────────────────
+# SHAPE TABLE
+# ──────────────────────────────────────────────────────────────
+
+class ShapeTable(object):
+    """Column store of shape rows plus the interned palette, strings and styles."""
+
+    COLUMNS = Row._fields
+
+    def __init__(self, colors=None, strings=None, styles=None):
+        self.kind = array("B")
+        self.slide = array("I")
+        self.x = array("q")
+        self.y = array("q")
+        self.w = array("q")
+        self.h = array("q")
+        self.fill = array("H")
+        self.text = array("I")
+        self.style = array("H")
+        self.colors = colors if colors is not None else Interner()
+        self.strings = strings if strings is not None else Interner([""])
+        self.styles = styles if styles is not None else Interner([None])
+
+    def __len__(self):
+        return len(self.kind)
+
+    def append(self, kind, slide, x, y, w, h,
+               fill=NO_FILL, text=NO_TEXT, style=NO_STYLE):
+        """Append one row of already-interned ids; return its row index."""
+        self.kind.append(kind)
+        self.slide.append(slide)
+        self.x.append(x)
+        self.y.append(y)
+        self.w.append(w)
+        self.h.append(h)
+        self.fill.append(fill)
+        self.text.append(text)
+        self.style.append(style)
+        return len(self.kind) - 1
+
+    def extend(self, other, slide_offset=0):
+        """Append every row of *other*, which must share this table's interners."""
+        if (other.colors is not self.colors or other.strings is not self.strings
+                or other.styles is not self.styles):
+            raise ValueError("ShapeTable.extend needs tables with shared interners")
+        for c in self.COLUMNS:
+            if c != "slide":
+                getattr(self, c).extend(getattr(other, c))
+        self.slide.extend(array("I", (s + slide_offset for s in other.slide)))
+        return self
+
+    def row(self, i):
+        return Row(*(getattr(self, c)[i] for c in self.COLUMNS))
+
+    def rows(self):
+        return (Row(*r) for r in zip(*(getattr(self, c) for c in self.COLUMNS)))
+
+    def nbytes(self):
+        """Bytes held by the row columns (excluding interned tables)."""
+        return sum(getattr(self, c).itemsize * len(self) for c in self.COLUMNS)
+
+    # ── transforms ────────────────────────────────────────────
+
+    def reflow(self, dx=0, dy=0, scale=1.0, slides=None):
+        """Scale then offset every row's box in place, optionally only on *slides*."""
+        slides = set(slides) if slides is not None else None
+        for col, delta in ((self.x, dx), (self.y, dy), (self.w, 0), (self.h, 0)):
+            for i, v in enumerate(col):
+                if slides is None or self.slide[i] in slides:
+                    col[i] = int(v * scale) + delta
+        return self
+
+    def recolour(self, mapping):
+        """
+        Swap palette colours in place; every fill and text style follows.
+
+        Tables that share this palette (the fragments of one ScriptCompiler,
+        say) are recoloured too; tables from select() / filter() are not.
+        """
+        for idx, color in enumerate(self.colors.values):
+            if color in mapping:
+                self.colors.values[idx] = mapping[color]
+        self.colors._ids = {c: i for i, c in enumerate(self.colors.values)}
+        return self
+
+    def select(self, keep):
+        """
+        Return a new table holding the rows whose entry in *keep* is true.
+
+        The new table gets its own copy of the palette, so recolouring it
+        leaves this one alone; strings and styles are shared.
+        """
+        keep = list(keep)
+        out = ShapeTable(self.colors.copy(), self.strings, self.styles)
+        for c in self.COLUMNS:
+            src = getattr(self, c)
+            getattr(out, c).extend(v for v, k in zip(src, keep) if k)
+        return out
+
+    def filter(self, kinds=None, slides=None):
+        """Return a new table restricted to the given kinds and/or slides."""
+        kinds = set(kinds) if kinds is not None else None
+        slides = set(slides) if slides is not None else None
+        return self.select(
+            (kinds is None or k in kinds) and (slides is None or s in slides)
+            for k, s in zip(self.kind, self.slide))
+
+    def as_numpy(self):
+        """Zero-copy NumPy views of the row columns (requires numpy)."""
+        import numpy as np
+        return {c: np.frombuffer(getattr(self, c), dtype=getattr(self, c).typecode)
+                for c in self.COLUMNS}
+
+
+# ──────────────────────────────────────────────────────────────
+# RECORDING
+# ──────────────────────────────────────────────────────────────
+
+class IRSlide(object):
+    """Recorder handed to the generate_ppt helpers in place of a slide."""
+
+    is_recording = True
+
+    def __init__(self, deck, index):
+        self.deck = deck
+        self.index = index
+
+    def record_background(self, color):
+        t = self.deck.table
+        return t.append(KIND_BACKGROUND, self.index, 0, 0,
+                        self.deck.slide_width, self.deck.slide_height,
+                        fill=t.colors.intern(color))
+
+    def record_shape(self, kind, x, y, w, h, color):
+        t = self.deck.table
+        return t.append(_KIND_BY_NAME[kind], self.index, x, y, w, h,
+                        fill=t.colors.intern(color))
+
+    def record_text(self, x, y, w, h, text, font_size, color, bold,
+                    alignment, font_name, word_wrap):
+        t = self.deck.table
+        style = TextStyle(font_size, t.colors.intern(color), bold,
+                          alignment, font_name, word_wrap)
+        return t.append(KIND_TEXT, self.index, x, y, w, h,
+                        text=t.strings.intern(text),
+                        style=t.styles.intern(style))
+
+
+class IRDeck(object):
+    """Stand-in for a Presentation that records slides into a ShapeTable."""
+
+    is_recording = True
+
+    def __init__(self, slide_width=gp.SLIDE_W, slide_height=gp.SLIDE_H, table=None):
+        self.slide_width = slide_width
+        self.slide_height = slide_height
+        self.slide_count = 0
+        self.table = table if table is not None else ShapeTable()
+        self.notes = {}               # slide index -> speaker notes
+
+    def add_slide(self):
+        slide = IRSlide(self, self.slide_count)
+        self.slide_count += 1
+        return slide
+
+    # ── materialisation ───────────────────────────────────────
+
+    def boxes(self):
+        """Yield ppt_lint Box records so the linter can run without python-pptx."""
+        from ppt_lint import KIND_CARD as LINT_CARD, KIND_RECT as LINT_RECT, \
+            KIND_TEXT as LINT_TEXT, Box
+
+        t = self.table
+        inset = (gp.Inches(0.1), gp.Inches(0.05), gp.Inches(0.1), gp.Inches(0.05))
+        for i, r in enumerate(t.rows()):
+            if r.kind == KIND_TEXT:
+                st = t.styles[r.style]
+                yield Box(r.slide + 1, i, "text", LINT_TEXT, r.x, r.y, r.x + r.w, r.y + r.h,
+                          t.strings[r.text], st.font_size, t.colors[st.color],
+                          st.bold, st.word_wrap, inset)
+            elif r.kind != KIND_BACKGROUND:
+                kind = LINT_CARD if r.kind == KIND_CARD else LINT_RECT
+                yield Box(r.slide + 1, i, "shape", kind, r.x, r.y, r.x + r.w, r.y + r.h,
+                          "", None, None, False, True, (0, 0, 0, 0))
+
+    def to_presentation(self):
+        """Create the python-pptx objects for every recorded row."""
+        prs = Presentation()
+        prs.slide_width = self.slide_width
+        prs.slide_height = self.slide_height
+        layout = prs.slide_layouts[6]
+        slides = [prs.slides.add_slide(layout) for _ in range(self.slide_count)]
+
+        t = self.table
+        for r in t.rows():
+            slide = slides[r.slide]
+            if r.kind == KIND_BACKGROUND:
+                fill = slide.background.fill
+                fill.solid()
+                fill.fore_color.rgb = t.colors[r.fill]
+            elif r.kind == KIND_TEXT:
+                st = t.styles[r.style]
+                tb = slide.shapes.add_textbox(r.x, r.y, r.w, r.h)
+                tf = tb.text_frame
+                tf.word_wrap = st.word_wrap
+                p = tf.paragraphs[0]
+                p.text = t.strings[r.text]
+                p.font.size = st.font_size
+                p.font.color.rgb = t.colors[st.color]
+                p.font.bold = st.bold
+                p.font.name = st.font_name
+                p.alignment = st.alignment
+                gp._no_border(tb)
+            else:
+                shape = slide.shapes.add_shape(_AUTO_SHAPE[r.kind], r.x, r.y, r.w, r.h)
+                shape.fill.solid()
+                shape.fill.fore_color.rgb = t.colors[r.fill]
+                gp._no_border(shape)
+
+        for idx, text in self.notes.items():
+            slides[idx].notes_slide.notes_text_frame.text = text
+        return prs
+
+    def save(self, path):
+        prs = self.to_presentation()
+        prs.save(path)
+        return prs
+
+
+def record_deck(builders=gp.SLIDE_BUILDERS, deck=None):
+    """Run slide builders against an IRDeck and return it."""
+    deck = deck if deck is not None else IRDeck()
+    for builder in builders:
+        builder(deck)
+    return deck
+
+
+# ──────────────────────────────────────────────────────────────
+# MAIN
+# ──────────────────────────────────────────────────────────────
+
+def _bench(n_shapes):
+    t0 = time.perf_counter()
+    deck = IRDeck()
+    while len(deck.table) < n_shapes:
+        record_deck(deck=deck)
+    t1 = time.perf_counter()
+    table = deck.table
+    table.reflow(dx=gp.Inches(0.1), scale=0.98)
+    t2 = time.perf_counter()
+    table.recolour({gp.ELECTRIC_BLUE: gp.TEAL})
+    t3 = time.perf_counter()
+    texts = table.filter(kinds=[KIND_TEXT])
+    t4 = time.perf_counter()
+
+    print("[OK] Recorded {:,} shapes on {:,} slides".format(len(table), deck.slide_count))
+    print("     columns:  {:.1f} MB  ({:.1f} B/shape)".format(
+        table.nbytes() / 1e6, table.nbytes() / float(len(table))))
+    print("     interned: {} colours, {} strings, {} styles".format(
+        len(table.colors), len(table.strings), len(table.styles)))
+    print("     record    {:.2f}s".format(t1 - t0))
+    print("     reflow    {:.2f}s".format(t2 - t1))
+    print("     recolour  {:.4f}s".format(t3 - t2))
+    print("     filter    {:.2f}s  ({:,} text rows)".format(t4 - t3, len(texts)))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the columnar shape IR.")
+    parser.add_argument("--shapes", type=int, default=1000000)
+    parser.add_argument("-o", "--out", help="also materialise one deck to this .pptx")
+    args = parser.parse_args()
+    _bench(args.shapes)
+    if args.out:
+        record_deck().save(args.out)
+        print("[OK] Presentation saved -> {}".format(args.out))
+    sys.exit(0)
@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+MailMind — Presentation Layout Linter
+Team Cipher | AI-Powered Smart Email Assistant
+
+Checks every slide of a generated deck for:
+  * shapes that fall outside the slide            (error)
+  * text boxes that collide with each other, and
+    rects / cards that collide with their own kind (error)
+  * text with contrast below 3:1 against the bg   (error)
+  * small text with contrast below 4.5:1          (warning)
+  * text boxes smaller than their measured text   (warning)
+
+Text over a card or rect, and a rect (accent bar, divider) over a
+card, are intended layering and are not reported.
+
+Overlaps are found with a sweep line over the shape bounding boxes:
+boxes enter in order of their left edge, and the active set is held
+in two static trees over the y axis (a segment tree of intervals for
+stabbing queries and a count tree of top edges for range queries), so
+a deck costs O((n + k) log n) where k is the number of intersecting
+pairs.
+
+Warnings are only printed on request, and a warning repeated on many
+slides (e.g. the house footer) is reported once.
+
+Run:       python mailmindd/ppt_lint.py [deck.pptx] [--warnings]
+Requires:  pip install python-pptx
+"""
+
+import bisect
+import functools
+import heapq
+import sys
+from collections import namedtuple
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE
+from pptx.text.text import Font
+from pptx.util import Inches, Pt
+
+# ──────────────────────────────────────────────────────────────
+# THRESHOLDS
+# ──────────────────────────────────────────────────────────────
+OVERLAP_TOLERANCE = Inches(0.06)   # title/subtitle rows touch by 0.05"
+OVERFLOW_TOLERANCE = Inches(0.05)
+MIN_CONTRAST = 3.0                 # WCAG AA, large text / UI
+MIN_CONTRAST_SMALL = 4.5           # WCAG AA, body text
+LARGE_TEXT = Pt(18)
+LARGE_TEXT_BOLD = Pt(14)
+LINE_SPACING = 1.2                 # line height as a multiple of font size
+
+ERROR = "error"
+WARNING = "warning"
+
+KIND_TEXT = "text"
+KIND_RECT = "rect"
+KIND_CARD = "card"
+
+Box = namedtuple("Box", "slide index name kind left top right bottom "
+                        "text font_size color bold word_wrap insets")
+Issue = namedtuple("Issue", "severity slide rule message")
+
+
+# ──────────────────────────────────────────────────────────────
+# TEXT METRICS
+# ──────────────────────────────────────────────────────────────
+
+_NARROW = set("iljtfrI.,:;'|!()[]{} ")
+_WIDE = set("MWmw@%")
+
+
+def _char_em(ch):
+    """Approximate Calibri advance width of a character, in ems."""
+    if ch in _NARROW:
+        return 0.28
+    if ch in _WIDE:
+        return 0.82
+    if ord(ch) > 0x2000:          # arrows, bullets, emoji, CJK
+        return 1.0
+    if ch.isupper() or ch.isdigit():
+        return 0.56
+    return 0.48
+
+
+@functools.lru_cache(maxsize=8192)
+def _word_em(word):
+    return sum(_char_em(ch) for ch in word)
+
+
+@functools.lru_cache(maxsize=4096)
+def wrap_text(text, font_size, width=None, bold=False):
+    """
+    Split *text* into a tuple of (line, width_emu) set in *font_size*.
+
+    When *width* is given the text is greedily word-wrapped to it, the
+    same way PowerPoint flows a text frame with word wrap enabled.
+    """
+    scale = font_size * (1.05 if bold else 1.0)
+    space = _char_em(" ") * scale
+    lines = []
+    for raw_line in text.split("\n"):
+        words = []
+        line_w = 0
+        for word in raw_line.split(" "):
+            word_w = _word_em(word) * scale
+            if words and width is not None and line_w + space + word_w > width:
+                lines.append((" ".join(words), int(line_w)))
+                words, line_w = [word], word_w
+            else:
+                line_w += (space if words else 0) + word_w
+                words.append(word)
+        lines.append((" ".join(words), int(line_w)))
+    return tuple(lines)
+
+
+def measure_text(text, font_size, width=None, bold=False):
+    """Return (width, height) in EMU of *text* wrapped as by wrap_text()."""
+    lines = wrap_text(text, font_size, width, bold)
+    widest = max(w for _, w in lines)
+    return widest, int(len(lines) * font_size * LINE_SPACING)
+
+
+def _luminance(rgb):
+    """WCAG relative luminance of an RGBColor."""
+    def channel(c):
+        c = c / 255.0
+        return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+    r, g, b = rgb
+    return 0.2126 * channel(r) + 0.7152 * channel(g) + 0.0722 * channel(b)
+
+
+def contrast_ratio(fg, bg):
+    """WCAG contrast ratio between two RGBColors (1.0 – 21.0)."""
+    hi, lo = sorted((_luminance(fg), _luminance(bg)), reverse=True)
+    return (hi + 0.05) / (lo + 0.05)
+
+
+# ──────────────────────────────────────────────────────────────
+# SHAPE EXTRACTION
+# ──────────────────────────────────────────────────────────────
+
+def _text_style(tf):
+    """Return (font_size, color, bold) of the first paragraph of a text frame."""
+    # Read the XML directly: the .font properties of runs and paragraphs
+    # add empty rPr / defRPr elements, and linting must not edit the deck.
+    p = tf.paragraphs[0]._p
+    rPr = p.r_lst[0].rPr if p.r_lst else None
+    if rPr is None or rPr.sz is None:
+        rPr = p.pPr.defRPr if p.pPr is not None else None
+    if rPr is None:
+        return Pt(18), None, False
+    font = Font(rPr)
+    size = font.size or Pt(18)
+    try:
+        color = font.color.rgb
+    except AttributeError:
+        color = None
+    return size, color, bool(font.bold)
+
+
+def boxes_from_presentation(prs):
+    """Yield a Box for every shape on every slide of *prs*."""
+    for slide_no, slide in enumerate(prs.slides, start=1):
+        for index, shape in enumerate(slide.shapes):
+            text, font_size, color, bold = "", None, None, False
+            word_wrap, insets = True, (0, 0, 0, 0)
+            if shape.has_text_frame and shape.text_frame.text.strip():
+                tf = shape.text_frame
+                text = tf.text
+                font_size, color, bold = _text_style(tf)
+                word_wrap = tf.word_wrap is not False
+                insets = (tf.margin_left, tf.margin_top,
+                          tf.margin_right, tf.margin_bottom)
+            if shape.shape_type == MSO_SHAPE_TYPE.TEXT_BOX or text:
+                kind = KIND_TEXT
+            elif (shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE and
+                  shape.auto_shape_type == MSO_SHAPE.ROUNDED_RECTANGLE):
+                kind = KIND_CARD
+            else:
+                kind = KIND_RECT
+            yield Box(slide_no, index, shape.name, kind,
+                      shape.left, shape.top,
+                      shape.left + shape.width, shape.top + shape.height,
+                      text, font_size, color, bold, word_wrap, insets)
+
+
+# ──────────────────────────────────────────────────────────────
+# CHECKS
+# ──────────────────────────────────────────────────────────────
+
+def _describe(box):
+    label = box.text.splitlines()[0][:30] if box.text else box.name
+    return "'{}' @ ({:.2f}\", {:.2f}\")".format(
+        label, box.left / 914400, box.top / 914400)
+
+
+def _overlap(a, b, tolerance=0):
+    """True when the interiors of *a* and *b* intersect by more than *tolerance* on both axes."""
+    return (min(a.right, b.right) - max(a.left, b.left) > tolerance and
+            min(a.bottom, b.bottom) - max(a.top, b.top) > tolerance)
+
+
+def _layered(a, b):
+    """True for intended layering: text over a shape, or a rect over a card."""
+    kinds = {a.kind, b.kind}
+    return len(kinds) == 2 and (KIND_TEXT in kinds or kinds == {KIND_RECT, KIND_CARD})
+
+
+def _tree_nodes(lo, hi, size):
+    """Canonical nodes of an iterative segment tree covering leaves [lo, hi)."""
+    lo += size
+    hi += size
+    while lo < hi:
+        if lo & 1:
+            yield lo
+            lo += 1
+        if hi & 1:
+            hi -= 1
+            yield hi
+        lo >>= 1
+        hi >>= 1
+
+
+def overlapping_pairs(boxes, tolerance=0):
+    """
+    Yield every pair of boxes whose interiors intersect by more than
+    *tolerance* on both axes, as (earlier, later) in left-edge order.
+
+    Sweep line on x: boxes enter in order of their left edge and leave
+    (via a heap on their right edge) once the sweep passes them.  For a
+    new box B, an active box A overlaps on y iff either
+      * A.top lies in [B.top, B.bottom - tol)  — range query on a count
+        tree over all top edges, descending only into non-empty nodes;
+      * A.top < B.top and A spans B.top + tol — stabbing query on a
+        segment tree whose nodes hold the active intervals covering them.
+    Both cost O(log n) plus the boxes they report.
+    """
+    boxes = [b for b in boxes
+             if b.right - b.left > tolerance and b.bottom - b.top > tolerance]
+    n = len(boxes)
+    if n < 2:
+        return
+
+    by_top = sorted(range(n), key=lambda i: boxes[i].top)
+    tops = [boxes[i].top for i in by_top]
+    top_pos = [0] * n
+    for pos, i in enumerate(by_top):
+        top_pos[i] = pos
+    size = 1
+    while size < n:
+        size *= 2
+    counts = [0] * (2 * size)
+
+    coords = sorted({b.top for b in boxes} | {b.bottom for b in boxes})
+    csize = 1
+    while csize < len(coords) - 1:
+        csize *= 2
+    cover = [None] * (2 * csize)
+    cover_nodes = {}
+
+    def insert(i):
+        node = top_pos[i] + size
+        while node:
+            counts[node] += 1
+            node >>= 1
+        lo = bisect.bisect_left(coords, boxes[i].top)
+        hi = bisect.bisect_left(coords, boxes[i].bottom)
+        nodes = cover_nodes[i] = list(_tree_nodes(lo, hi, csize))
+        for node in nodes:
+            if cover[node] is None:
+                cover[node] = set()
+            cover[node].add(i)
+
+    def remove(i):
+        node = top_pos[i] + size
+        while node:
+            counts[node] -= 1
+            node >>= 1
+        for node in cover_nodes.pop(i):
+            cover[node].discard(i)
+
+    def tops_in(lo, hi):
+        for root in _tree_nodes(lo, hi, size):
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                if not counts[node]:
+                    continue
+                if node >= size:
+                    yield by_top[node - size]
+                else:
+                    stack.append(2 * node)
+                    stack.append(2 * node + 1)
+
+    def spanning(point):
+        leaf = bisect.bisect_right(coords, point) - 1
+        if not 0 <= leaf < len(coords) - 1:
+            return
+        node = leaf + csize
+        while node:
+            if cover[node]:
+                for i in cover[node]:
+                    yield i
+            node >>= 1
+
+    leaving = []                  # heap of (right, index)
+    for i in sorted(range(n), key=lambda i: boxes[i].left):
+        box = boxes[i]
+        while leaving and leaving[0][0] <= box.left + tolerance:
+            remove(heapq.heappop(leaving)[1])
+        lo = bisect.bisect_left(tops, box.top)
+        hi = bisect.bisect_left(tops, box.bottom - tolerance)
+        candidates = list(tops_in(lo, hi))
+        candidates.extend(j for j in spanning(box.top + tolerance)
+                          if boxes[j].top < box.top)
+        for j in candidates:
+            if _overlap(boxes[j], box, tolerance):
+                yield boxes[j], box
+        insert(i)
+        heapq.heappush(leaving, (box.right, i))
+
+
+def check_bounds(box, slide_w, slide_h):
+    if box.left < 0 or box.top < 0 or box.right > slide_w or box.bottom > slide_h:
+        yield Issue(ERROR, box.slide, "off-slide",
+                    "{} extends past the slide edge".format(_describe(box)))
+
+
+def check_text_fit(box):
+    left, top, right, bottom = box.insets
+    avail_w = box.right - box.left - left - right
+    avail_h = box.bottom - box.top - top - bottom
+    width, height = measure_text(box.text, box.font_size,
+                                 avail_w if box.word_wrap else None, box.bold)
+    if height > avail_h + OVERFLOW_TOLERANCE or (
+            not box.word_wrap and width > avail_w + OVERFLOW_TOLERANCE):
+        yield Issue(WARNING, box.slide, "text-overflow",
+                    "{} needs {:.2f}\" x {:.2f}\" but has {:.2f}\" x {:.2f}\"".format(
+                        _describe(box), width / 914400, height / 914400,
+                        avail_w / 914400, avail_h / 914400))
+
+
+def check_contrast(box, bg_color):
+    if box.color is None:
+        return
+    ratio = contrast_ratio(box.color, bg_color)
+    large = box.font_size >= (LARGE_TEXT_BOLD if box.bold else LARGE_TEXT)
+    if ratio < MIN_CONTRAST:
+        yield Issue(ERROR, box.slide, "contrast",
+                    "{} has contrast {:.2f}:1 against the background".format(
+                        _describe(box), ratio))
+    elif not large and ratio < MIN_CONTRAST_SMALL:
+        yield Issue(WARNING, box.slide, "contrast",
+                    "{} is small text with contrast {:.2f}:1".format(
+                        _describe(box), ratio))
+
+
+def lint_boxes(boxes, slide_w, slide_h, bg_color):
+    """Run every check over an iterable of Box records; return a list of Issues."""
+    issues = []
+    by_slide = {}
+    for box in boxes:
+        by_slide.setdefault(box.slide, []).append(box)
+        issues.extend(check_bounds(box, slide_w, slide_h))
+        if box.text:
+            issues.extend(check_text_fit(box))
+            issues.extend(check_contrast(box, bg_color))
+
+    for slide_boxes in by_slide.values():
+        for a, b in overlapping_pairs(slide_boxes, OVERLAP_TOLERANCE):
+            if _layered(a, b):
+                continue
+            first, second = sorted((a, b), key=lambda x: x.index)
+            issues.append(Issue(ERROR, a.slide, "overlap",
+                                "{} overlaps {}".format(_describe(first),
+                                                        _describe(second))))
+    issues.sort(key=lambda i: (i.slide, i.severity != ERROR, i.rule))
+    return issues
+
+
+def lint_presentation(prs, bg_color):
+    """Lint a python-pptx Presentation whose slides sit on *bg_color*."""
+    return lint_boxes(boxes_from_presentation(prs),
+                      prs.slide_width, prs.slide_height, bg_color)
+
+
+def report(issues, stream=None, warnings=False):
+    """
+    Print errors (and warnings when asked) and return the number of errors.
+
+    Identical findings on several slides are printed once with the list
+    of slides they occur on.
+    """
+    stream = stream or sys.stdout
+    errors = 0
+    grouped = {}
+    for issue in issues:
+        errors += issue.severity == ERROR
+        if issue.severity == ERROR or warnings:
+            key = (issue.severity, issue.rule, issue.message)
+            grouped.setdefault(key, []).append(issue.slide)
+    for (severity, rule, message), slides in grouped.items():
+        where = "slide {:>2}".format(slides[0]) if len(slides) == 1 else \
+            "slides {}".format(",".join(str(n) for n in slides))
+        stream.write("[{}] {}  {:<13} {}\n".format(severity.upper(), where, rule, message))
+    return errors
+
+
+# ──────────────────────────────────────────────────────────────
+# MAIN
+# ──────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    import argparse
+
+    from generate_ppt import BG_COLOR, build_presentation
+
+    parser = argparse.ArgumentParser(description="Lint a MailMind deck layout.")
+    parser.add_argument("deck", nargs="?", help=".pptx to lint (default: build one)")
+    parser.add_argument("--warnings", action="store_true", help="also print warnings")
+    args = parser.parse_args()
+
+    deck = Presentation(args.deck) if args.deck else build_presentation()
+    n_errors = report(lint_presentation(deck, BG_COLOR), warnings=args.warnings)
+    sys.exit(1 if n_errors else 0)
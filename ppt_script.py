@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+MailMind — Markdown-to-Deck Compiler
+Team Cipher | AI-Powered Smart Email Assistant
+
+Compiles PRESENTATION_SCRIPT.md into a deck with speaker notes.
+
+  * "## Slide N: Title" sections run slide_NN_* from generate_ppt, or a
+    generic title/bullet slide when there is no builder N.
+  * Other "##" sections become generic slides only with --appendix.
+  * The section prose (script, stage directions, transition) becomes
+    the slide's speaker notes.
+
+The markdown is parsed in one streaming pass.  Each section is
+compiled into a ppt_ir fragment cached by the SHA-1 of its text, so
+with --watch an edit to one section only re-runs that slide's builder.
+
+Generates: mailmindd/MailMind_AlgoQuest_R2.pptx (with notes)
+Run:       python mailmindd/ppt_script.py [script.md] [-o out.pptx]
+                                          [--appendix] [--watch]
+Requires:  pip install python-pptx
+"""
+
+import hashlib
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+
+from pptx.util import Pt
+
+import generate_ppt as gp
+from ppt_ir import Interner, IRDeck, ShapeTable
+
+SLIDE_HEADING = re.compile(r"^Slide\s+(\d+)\s*[:.\-–—]?\s*(.*)$", re.IGNORECASE)
+LIST_ITEM = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+(?:\[[ xX]\]\s+)?(.*)$")
+EMPHASIS = re.compile(r"(\*\*|__|\*|`)")
+FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+
+MAX_BULLETS = 8
+MAX_BULLET_CHARS = 100
+
+Section = namedtuple("Section", "number title lines digest")
+CompiledSlide = namedtuple("CompiledSlide", "table slide_count notes")
+
+
+# ──────────────────────────────────────────────────────────────
+# PARSING
+# ──────────────────────────────────────────────────────────────
+
+def _section(heading, lines, hasher):
+    title = heading.lstrip("#").strip()
+    m = SLIDE_HEADING.match(title)
+    number = None
+    if m:
+        number, title = int(m.group(1)), m.group(2).strip() or title
+    return Section(number, title, lines, hasher.hexdigest())
+
+
+def _fence(line, fence):
+    """Return the code fence open after *line*, given the one open before it."""
+    m = FENCE.match(line)
+    if m is None:
+        return fence
+    marker = m.group(1)
+    if fence is None:
+        return marker
+    if marker[0] == fence[0] and len(marker) >= len(fence) and line.strip() == marker:
+        return None
+    return fence
+
+
+def parse_sections(lines):
+    """
+    Yield a Section for every "##" heading in an iterable of markdown lines.
+
+    A "#" heading ends the current section without starting a new one,
+    so top-level parts (e.g. a Q&A appendix) never bleed into a slide.
+    Lines inside fenced code blocks are never headings.
+    """
+    heading, body, hasher, fence = None, None, None, None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if fence is None and (line.startswith("# ") or line.startswith("## ")):
+            if heading is not None:
+                yield _section(heading, body, hasher)
+                heading = None
+            if line.startswith("## "):
+                heading, body = line, []
+                hasher = hashlib.sha1(line.encode("utf-8"))
+            continue
+        fence = _fence(line, fence)
+        if heading is not None:
+            body.append(line)
+            hasher.update(b"\n")
+            hasher.update(line.encode("utf-8"))
+    if heading is not None:
+        yield _section(heading, body, hasher)
+
+
+def _plain(text):
+    return EMPHASIS.sub("", text).strip()
+
+
+def speaker_notes(lines):
+    """
+    Turn a section body into plain-text notes, one paragraph per block.
+
+    Fenced code is kept line for line, without its fence markers.
+    """
+    paragraphs, current, code, fence = [], [], [], None
+    for line in lines:
+        opened, fence = fence, _fence(line, fence)
+        if fence != opened:                # a fence marker starts or ends code
+            for block in (current, code):
+                if block:
+                    paragraphs.append((" " if block is current else "\n").join(block))
+            current, code = [], []
+            continue
+        if fence is not None:
+            code.append(line.rstrip())
+            continue
+        stripped = line.strip()
+        if stripped.startswith(">"):
+            stripped = stripped.lstrip(">").strip()
+        if not stripped or set(stripped) <= set("-|: "):
+            if current:
+                paragraphs.append(" ".join(current))
+                current = []
+            continue
+        if stripped.startswith("#"):
+            stripped = stripped.lstrip("#").strip()
+        current.append(_plain(stripped))
+    if current:
+        paragraphs.append(" ".join(current))
+    if code:                                # unclosed fence
+        paragraphs.append("\n".join(code))
+    return "\n\n".join(paragraphs)
+
+
+def bullets(lines):
+    """Collect list items and "###" sub-headings (outside code) as slide bullets."""
+    out, fence = [], None
+    for line in lines:
+        opened, fence = fence, _fence(line, fence)
+        if opened is not None or fence is not None:
+            continue
+        text = line.strip()
+        if text.startswith("### "):
+            item = text[4:]
+        else:
+            m = LIST_ITEM.match(text)
+            if not m:
+                continue
+            item = m.group(1)
+        item = _plain(item)
+        if len(item) > MAX_BULLET_CHARS:
+            item = item[:MAX_BULLET_CHARS - 1].rstrip() + "…"
+        out.append(item)
+        if len(out) == MAX_BULLETS:
+            break
+    return out
+
+
+# ──────────────────────────────────────────────────────────────
+# GENERIC SLIDE
+# ──────────────────────────────────────────────────────────────
+
+def slide_generic(prs, title, items):
+    """Title + bullet slide for script sections without a dedicated builder."""
+    slide = gp.new_slide(prs)
+    gp.add_slide_title(slide, title)
+
+    colors = (gp.ELECTRIC_BLUE, gp.TEAL, gp.PURPLE, gp.AMBER, gp.GREEN, gp.RED)
+    y = 1.6
+    for i, item in enumerate(items):
+        color = colors[i % len(colors)]
+        gp.add_rect(slide, 0.8, y, 0.08, 0.5, color)
+        gp.add_text_box(slide, 1.1, y + 0.05, 11.4, 0.4, item,
+                        font_size=Pt(17), color=gp.WHITE)
+        y += 0.62
+
+
+# ──────────────────────────────────────────────────────────────
+# COMPILER
+# ──────────────────────────────────────────────────────────────
+
+class ScriptCompiler(object):
+    """Compiles script sections to IR fragments, caching them by content hash."""
+
+    def __init__(self, appendix=False):
+        self.appendix = appendix
+        self.colors = Interner()
+        self.strings = Interner([""])
+        self.styles = Interner([None])
+        self.cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _table(self):
+        return ShapeTable(self.colors, self.strings, self.styles)
+
+    def compile_section(self, section):
+        cached = self.cache.get(section.digest)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+
+        fragment = IRDeck(table=self._table())
+        n = section.number
+        if n is not None and 1 <= n <= len(gp.SLIDE_BUILDERS):
+            gp.SLIDE_BUILDERS[n - 1](fragment)
+        else:
+            slide_generic(fragment, section.title, bullets(section.lines))
+        compiled = CompiledSlide(fragment.table, fragment.slide_count,
+                                 speaker_notes(section.lines))
+        self.cache[section.digest] = compiled
+        return compiled
+
+    def compile(self, lines):
+        """Compile an iterable of markdown lines into an IRDeck."""
+        deck = IRDeck(table=self._table())
+        live = set()
+        for section in parse_sections(lines):
+            if section.number is None and not self.appendix:
+                continue
+            live.add(section.digest)
+            compiled = self.compile_section(section)
+            deck.table.extend(compiled.table, slide_offset=deck.slide_count)
+            if compiled.notes:
+                deck.notes[deck.slide_count] = compiled.notes
+            deck.slide_count += compiled.slide_count
+        # Drop fragments for sections that were edited away
+        for digest in set(self.cache) - live:
+            del self.cache[digest]
+        return deck
+
+    def compile_file(self, path):
+        with open(path, encoding="utf-8") as f:
+            return self.compile(f)
+
+
+# ──────────────────────────────────────────────────────────────
+# MAIN
+# ──────────────────────────────────────────────────────────────
+
+def build(compiler, src, out_path, lint=True):
+    t0 = time.perf_counter()
+    deck = compiler.compile_file(src)
+    t1 = time.perf_counter()
+
+    if lint:
+        from ppt_lint import lint_boxes, report
+        n_errors = report(lint_boxes(deck.boxes(), deck.slide_width,
+                                     deck.slide_height, gp.BG_COLOR))
+        if n_errors:
+            print("[FAIL] Layout lint found {} error(s)".format(n_errors))
+            return False
+
+    deck.save(out_path)
+    print("[OK] Presentation saved -> {}".format(out_path))
+    print("     Slides: {}  (compiled in {:.1f} ms, {} cached / {} rebuilt)".format(
+        deck.slide_count, (t1 - t0) * 1000, compiler.hits, compiler.misses))
+    compiler.hits = compiler.misses = 0
+    return True
+
+
+def _mtime(path):
+    """Modification time of *path*, or None while an atomic save has it missing."""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def main(argv=None):
+    import argparse
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Compile the presentation script to a deck.")
+    parser.add_argument("script", nargs="?",
+                        default=os.path.join(script_dir, "PRESENTATION_SCRIPT.md"))
+    parser.add_argument("-o", "--out",
+                        default=os.path.join(script_dir, "MailMind_AlgoQuest_R2.pptx"))
+    parser.add_argument("--appendix", action="store_true",
+                        help="also turn non-'Slide N' sections into bullet slides")
+    parser.add_argument("--no-lint", action="store_true",
+                        help="skip the layout lint pass")
+    parser.add_argument("--watch", action="store_true",
+                        help="recompile whenever the script changes")
+    args = parser.parse_args(argv)
+
+    compiler = ScriptCompiler(appendix=args.appendix)
+    ok = build(compiler, args.script, args.out, lint=not args.no_lint)
+    if not args.watch:
+        sys.exit(0 if ok else 1)
+
+    mtime = _mtime(args.script)
+    try:
+        while True:
+            time.sleep(0.5)
+            current = _mtime(args.script)
+            if current is None or current == mtime:
+                continue
+            mtime = current
+            try:
+                build(compiler, args.script, args.out, lint=not args.no_lint)
+            except Exception as exc:      # keep watching after a bad edit
+                print("[FAIL] Build failed: {}: {}".format(type(exc).__name__, exc))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
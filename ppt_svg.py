@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+MailMind — HTML/SVG Deck Preview
+Team Cipher | AI-Powered Smart Email Assistant
+
+Runs the slide_NN_* builders against the ppt_ir recorder and renders
+each slide as a self-contained SVG (rects, rounded cards, wrapped text
+and the deck palette), plus an index.html that inlines all of them.
+No python-pptx objects are created, so a full preview takes a few
+milliseconds.
+
+Generates: slide_01.svg … slide_12.svg, index.html
+Run:       python mailmindd/ppt_svg.py [out_dir]
+"""
+
+import os
+import sys
+import time
+from xml.sax.saxutils import escape, quoteattr
+
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches
+
+import generate_ppt as gp
+from ppt_ir import KIND_CARD, KIND_TEXT, record_deck
+from ppt_lint import LINE_SPACING, wrap_text
+
+EMU_PER_PX = 9525                 # 96 px per inch
+CARD_RADIUS = 0.16667             # default roundRect adjust value
+TEXT_INSET_X = Inches(0.1)
+TEXT_INSET_Y = Inches(0.05)
+ASCENT = 0.95                     # baseline offset as a multiple of font size
+FONT_STACK = "Calibri, Carlito, 'Segoe UI', sans-serif"
+
+_ANCHOR = {PP_ALIGN.CENTER: "middle", PP_ALIGN.RIGHT: "end"}
+
+
+def _px(emu):
+    return "{:.2f}".format(emu / float(EMU_PER_PX)).rstrip("0").rstrip(".")
+
+
+def _hex(rgb):
+    return "#{}".format(rgb)
+
+
+def _text_svg(x, y, w, h, text, st, color):
+    """Return the <text> element for one recorded text box."""
+    inner_w = w - 2 * TEXT_INSET_X
+    lines = wrap_text(text, st.font_size, inner_w if st.word_wrap else None, st.bold)
+    anchor = _ANCHOR.get(st.alignment, "start")
+    if anchor == "middle":
+        tx = x + w // 2
+    elif anchor == "end":
+        tx = x + w - TEXT_INSET_X
+    else:
+        tx = x + TEXT_INSET_X
+    baseline = y + TEXT_INSET_Y + int(st.font_size * ASCENT)
+    step = int(st.font_size * LINE_SPACING)
+
+    spans = []
+    for n, (line, _) in enumerate(lines):
+        spans.append('<tspan x="{}" y="{}">{}</tspan>'.format(
+            _px(tx), _px(baseline + n * step), escape(line)))
+    return ('<text font-family={} font-size="{}" fill="{}"{} text-anchor="{}" '
+            'xml:space="preserve">{}</text>').format(
+                quoteattr(st.font_name + ", " + FONT_STACK), _px(st.font_size),
+                _hex(color), ' font-weight="bold"' if st.bold else "",
+                anchor, "".join(spans))
+
+
+def slide_svgs(deck):
+    """Return one standalone SVG document (str) per recorded slide."""
+    t = deck.table
+    bodies = [[] for _ in range(deck.slide_count)]
+    for r in t.rows():
+        out = bodies[r.slide]
+        if r.kind == KIND_TEXT:
+            st = t.styles[r.style]
+            out.append(_text_svg(r.x, r.y, r.w, r.h, t.strings[r.text],
+                                 st, t.colors[st.color]))
+        else:
+            rx = ""
+            if r.kind == KIND_CARD:
+                rx = ' rx="{}"'.format(_px(int(min(r.w, r.h) * CARD_RADIUS)))
+            out.append('<rect x="{}" y="{}" width="{}" height="{}"{} fill="{}"/>'.format(
+                _px(r.x), _px(r.y), _px(r.w), _px(r.h), rx, _hex(t.colors[r.fill])))
+
+    head = ('<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" '
+            'viewBox="0 0 {w} {h}">').format(w=_px(deck.slide_width),
+                                              h=_px(deck.slide_height))
+    return [head + "".join(body) + "</svg>\n" for body in bodies]
+
+
+def preview_html(svgs, title="MailMind — Deck Preview"):
+    """Return a single HTML page inlining every slide SVG."""
+    slides = "\n".join('<section id="slide-{:02d}">{}</section>'.format(n, svg)
+                       for n, svg in enumerate(svgs, start=1))
+    return ("<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>{}</title>"
+            "<style>body{{background:{};margin:0;padding:24px}}"
+            "section{{margin:0 auto 24px;max-width:1280px}}"
+            "section svg{{width:100%;height:auto;display:block}}</style>"
+            "</head><body>\n{}\n</body></html>\n").format(
+                escape(title), _hex(gp.CARD_BG), slides)
+
+
+def export_svg(out_dir, deck=None):
+    """Write slide_NN.svg files and index.html into *out_dir*; return the SVGs."""
+    deck = deck if deck is not None else record_deck()
+    svgs = slide_svgs(deck)
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+    for n, svg in enumerate(svgs, start=1):
+        with open(os.path.join(out_dir, "slide_{:02d}.svg".format(n)), "w",
+                  encoding="utf-8") as f:
+            f.write(svg)
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(preview_html(svgs))
+    return svgs
+
+
+# ──────────────────────────────────────────────────────────────
+# MAIN
+# ──────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    target = sys.argv[1] if len(sys.argv) > 1 else os.path.join(script_dir, "preview")
+
+    t0 = time.perf_counter()
+    rendered = slide_svgs(record_deck())
+    elapsed = time.perf_counter() - t0
+    export_svg(target)
+    print("[OK] Preview saved -> {}".format(target))
+    print("     Slides: {}  ({:.1f} ms to record + render)".format(
+        len(rendered), elapsed * 1000))
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+MailMind — Shared-Part Variant Packaging
+Team Cipher | AI-Powered Smart Email Assistant
+
+Per-team variants of the deck differ only in the title slide and the
+footer text.  Instead of re-running every builder and re-serialising
+every part per variant, the deck is built once with placeholder tokens
+in those fields:
+
+  * zip entries without a token (theme, masters, layouts, content
+    types, …) are kept as their already-compressed bytes and written
+    out as one pre-assembled block;
+  * entries with a token (the slide XML) are split around the runs
+    holding the tokens and, per variant, joined with the runs
+    python-pptx would write for the values and deflated.
+
+So N variants cost one full build plus N small patches.  Only the
+package parts are stored once, not slides: the footer is a shape on
+every slide (where the linter and ppt_ir can see it), so all 12 slide
+parts carry a token and are re-joined and re-deflated per variant.
+
+Before anything is written, each distinct set of values is recorded
+onto the title slide (which carries the footer) through ppt_ir and
+linted.
+
+Generates: <out_dir>/MailMind_<name>.pptx for each variant
+Run:       python mailmindd/ppt_variants.py variants.json [-o out_dir] [--lint-warnings]
+           python mailmindd/ppt_variants.py --bench 800
+Requires:  pip install python-pptx
+"""
+
+import io
+import json
+import os
+import re
+import struct
+import time
+import zipfile
+import zlib
+from collections import namedtuple
+from xml.sax.saxutils import escape
+
+import generate_ppt as gp
+
+FIELDS = ("footer", "title", "subtitle", "team")
+TOKEN = "@@MAILMIND_{}@@"
+# python-pptx writes a token set as paragraph text as one bare run
+_TOKEN_RE = re.compile(rb"<a:r><a:t>@@MAILMIND_([A-Z]+)@@</a:t></a:r>")
+
+# How python-pptx turns _Paragraph.text into runs (pptx.oxml.text)
+_LINE_BREAK = re.compile("\n|\v")
+_CONTROL = re.compile("[\x00-\x08\x0b-\x1f]")
+_NOT_XML = re.compile("[\ud800-\udfff\ufffe\uffff]")
+
+DEFAULTS = {"footer": gp.FOOTER_TEXT, "title": gp.TITLE_TEXT,
+            "subtitle": gp.SUBTITLE_TEXT, "team": gp.TEAM_TEXT}
+
+Variant = namedtuple("Variant", ("name",) + FIELDS)
+Variant.__new__.__defaults__ = (None,) * len(FIELDS)
+
+# Zip record layouts (PKWARE APPNOTE 4.3.7, 4.3.12, 4.3.16)
+_LOCAL = struct.Struct("<4s5H3L2H")
+_CENTRAL = struct.Struct("<4s6H3L5H2L")
+_END = struct.Struct("<4s4H2LH")
+_DEFLATE_LEVEL = 6
+
+_Entry = namedtuple("_Entry", "name method dos_time dos_date crc csize usize data")
+
+
+def _variant_values(variant):
+    return {f: getattr(variant, f) if getattr(variant, f) is not None else DEFAULTS[f]
+            for f in FIELDS}
+
+
+def _runs_xml(value):
+    """
+    The <a:r> / <a:br/> elements python-pptx writes for paragraph text
+    *value*: line feeds and vertical tabs become breaks, empty runs are
+    left out and other control characters are escaped as "_xHHHH_".
+    Raises ValueError for characters an XML document cannot hold.
+    """
+    if _NOT_XML.search(value):
+        raise ValueError("{!r} contains characters XML cannot hold".format(value))
+    out = []
+    for i, line in enumerate(_LINE_BREAK.split(value)):
+        if i:
+            out.append("<a:br/>")
+        if line:
+            line = _CONTROL.sub(lambda m: "_x{:04X}_".format(ord(m.group())), line)
+            out.append("<a:r><a:t>{}</a:t></a:r>".format(escape(line)))
+    return "".join(out).encode("utf-8")
+
+
+def build_deck(values):
+    """Run every builder with the given footer / title-slide values."""
+    prs = gp.Presentation()
+    prs.slide_width = gp.SLIDE_W
+    prs.slide_height = gp.SLIDE_H
+    _title_slide(prs, values)
+    for builder in gp.SLIDE_BUILDERS[1:]:
+        builder(prs, footer=values["footer"])
+    return prs
+
+
+def _title_slide(prs, values):
+    gp.slide_01_title(prs, title=values["title"], subtitle=values["subtitle"],
+                      team=values["team"], footer=values["footer"])
+
+
+def lint_variant(variant):
+    """
+    Lint the parts of the deck *variant* changes: the title slide, which
+    also carries the footer every other slide repeats.
+    """
+    from ppt_ir import IRDeck
+    from ppt_lint import lint_boxes
+
+    deck = IRDeck()
+    _title_slide(deck, _variant_values(variant))
+    return lint_boxes(deck.boxes(), deck.slide_width, deck.slide_height, gp.BG_COLOR)
+
+
+def _check_values(variant, values, warnings):
+    """Return why *variant* cannot be written, or None; prints lint findings."""
+    from ppt_lint import ERROR, report
+
+    try:
+        for value in values:
+            _runs_xml(value)
+    except ValueError as exc:
+        return str(exc)
+    issues = lint_variant(variant)
+    blocking = [i for i in issues if i.severity == ERROR or i.rule == "text-overflow"]
+    report(blocking, warnings=True)
+    if warnings:
+        report([i for i in issues if i not in blocking], warnings=True)
+    if blocking:
+        return "layout lint found {} problem(s)".format(len(blocking))
+    return None
+
+
+def lint_variants(variants, warnings=False):
+    """
+    Lint each distinct set of variant values once, print the findings and
+    return the variants that pass.  Values python-pptx could not write
+    (characters XML cannot hold) fail too.
+
+    Text overflow blocks a variant here even though it is only a warning
+    for the main deck: the values are the one thing a variant changes.
+    """
+    problems = {}                   # distinct values -> why they fail, or None
+    passed = []
+    for v in variants:
+        key = tuple(_variant_values(v)[f] for f in FIELDS)
+        if key not in problems:
+            problems[key] = _check_values(v, key, warnings)
+        if problems[key]:
+            print("[FAIL] {}: {}".format(v.name, problems[key]))
+        else:
+            passed.append(v)
+    return passed
+
+
+def build_variant_direct(variant, out_path):
+    """Reference path: a full build and save for one variant."""
+    build_deck(_variant_values(variant)).save(out_path)
+
+
+# ──────────────────────────────────────────────────────────────
+# ZIP PRIMITIVES
+# ──────────────────────────────────────────────────────────────
+
+def _raw_entries(blob):
+    """Yield an _Entry with the still-compressed bytes of every member of *blob*."""
+    with zipfile.ZipFile(io.BytesIO(blob)) as zf:
+        for info in zf.infolist():
+            fields = _LOCAL.unpack_from(blob, info.header_offset)
+            start = info.header_offset + _LOCAL.size + fields[9] + fields[10]
+            yield _Entry(info.filename, info.compress_type, fields[4], fields[5],
+                         info.CRC, info.compress_size, info.file_size,
+                         blob[start:start + info.compress_size])
+
+
+def _deflate(data):
+    c = zlib.compressobj(_DEFLATE_LEVEL, zlib.DEFLATED, -15)
+    return c.compress(data) + c.flush()
+
+
+def _local_header(e):
+    name = e.name.encode("utf-8")
+    return _LOCAL.pack(b"PK\x03\x04", 20, 0, e.method, e.dos_time, e.dos_date,
+                       e.crc, e.csize, e.usize, len(name), 0) + name
+
+
+def _central_header(e, offset):
+    name = e.name.encode("utf-8")
+    return _CENTRAL.pack(b"PK\x01\x02", 20, 20, 0, e.method, e.dos_time, e.dos_date,
+                         e.crc, e.csize, e.usize, len(name), 0, 0, 0, 0, 0,
+                         offset) + name
+
+
+# ──────────────────────────────────────────────────────────────
+# TEMPLATE
+# ──────────────────────────────────────────────────────────────
+
+class VariantTemplate(object):
+    """A deck built once with tokens, ready to be stamped out per variant."""
+
+    def __init__(self):
+        buf = io.BytesIO()
+        build_deck({f: TOKEN.format(f.upper()) for f in FIELDS}).save(buf)
+
+        prefix, central = [], []
+        offset = 0
+        self.patched = []           # (_Entry, [bytes | field name, ...])
+        for entry in _raw_entries(buf.getvalue()):
+            data = zlib.decompress(entry.data, -15) if entry.method else entry.data
+            pieces = _TOKEN_RE.split(data)
+            if b"@@MAILMIND_" in b"".join(pieces[::2]):
+                raise ValueError("{}: placeholder outside a plain run".format(entry.name))
+            if len(pieces) == 1:
+                header = _local_header(entry)
+                central.append(_central_header(entry, offset))
+                prefix.append(header)
+                prefix.append(entry.data)
+                offset += len(header) + len(entry.data)
+            else:
+                # odd indices are token names, even indices are literal XML
+                parts = [p if i % 2 == 0 else p.decode("ascii").lower()
+                         for i, p in enumerate(pieces)]
+                self.patched.append((entry, parts))
+        self.prefix = b"".join(prefix)
+        self.prefix_central = b"".join(central)
+        self.shared_count = len(central)
+
+    def render(self, variant):
+        """Return the .pptx bytes for *variant*."""
+        values = {f: _runs_xml(v) for f, v in _variant_values(variant).items()}
+        out = [self.prefix]
+        central = [self.prefix_central]
+        offset = len(self.prefix)
+        for entry, parts in self.patched:
+            data = b"".join(values[p] if i % 2 else p for i, p in enumerate(parts))
+            e = entry._replace(method=zipfile.ZIP_DEFLATED, crc=zlib.crc32(data),
+                               usize=len(data), data=_deflate(data))
+            e = e._replace(csize=len(e.data))
+            header = _local_header(e)
+            central.append(_central_header(e, offset))
+            out.append(header)
+            out.append(e.data)
+            offset += len(header) + len(e.data)
+        cd = b"".join(central)
+        count = self.shared_count + len(self.patched)
+        out.append(cd)
+        out.append(_END.pack(b"PK\x05\x06", 0, 0, count, count, len(cd), offset, 0))
+        return b"".join(out)
+
+    def write(self, variant, out_path):
+        with open(out_path, "wb") as f:
+            f.write(self.render(variant))
+
+
+def load_variants(path):
+    """Read a JSON list of {"name": …, "footer": …, "title": …, …} objects."""
+    with open(path, encoding="utf-8") as f:
+        return [Variant(**item) for item in json.load(f)]
+
+
+def _out_path(out_dir, variant):
+    safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", variant.name)
+    return os.path.join(out_dir, "MailMind_{}.pptx".format(safe))
+
+
+# ──────────────────────────────────────────────────────────────
+# MAIN
+# ──────────────────────────────────────────────────────────────
+
+def bench(n_variants, out_dir, naive_sample=5):
+    variants = [Variant("team-{:03d}".format(i),
+                        footer="Team {:03d}  |  AlgoQuest 2025".format(i),
+                        team="Team {:03d}  |  AlgoQuest 2025 — Round 2".format(i))
+                for i in range(n_variants)]
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+
+    t0 = time.perf_counter()
+    for v in variants[:naive_sample]:
+        build_variant_direct(v, _out_path(out_dir, v))
+    naive_each = (time.perf_counter() - t0) / naive_sample
+
+    t0 = time.perf_counter()
+    template = VariantTemplate()
+    t1 = time.perf_counter()
+    for v in lint_variants(variants):
+        template.write(v, _out_path(out_dir, v))
+    t2 = time.perf_counter()
+
+    print("[OK] {} variants -> {}".format(n_variants, out_dir))
+    print("     full build (naive, per variant) {:8.1f} ms".format(naive_each * 1000))
+    print("     shared build (once)             {:8.1f} ms".format((t1 - t0) * 1000))
+    print("     lint + patch + write (each)     {:8.2f} ms  ({} shared / {} patched parts)".format(
+        (t2 - t1) * 1000 / n_variants, template.shared_count, len(template.patched)))
+    print("     total: {:.2f} s  vs  naive {:.2f} s  ({:.0f}x)".format(
+        t2 - t0, naive_each * n_variants, naive_each * n_variants / (t2 - t0)))
+
+
+def main(argv=None):
+    import argparse
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Package per-team deck variants.")
+    parser.add_argument("variants", nargs="?", help="JSON file listing the variants")
+    parser.add_argument("-o", "--out-dir", default=os.path.join(script_dir, "variants"))
+    parser.add_argument("--lint-warnings", action="store_true",
+                        help="also print layout lint warnings")
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="benchmark N synthetic variants against full builds")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        bench(args.bench, args.out_dir)
+        return
+    if not args.variants:
+        parser.error("a variants file or --bench N is required")
+
+    variants = load_variants(args.variants)
+    if not os.path.isdir(args.out_dir):
+        os.makedirs(args.out_dir)
+    passed = lint_variants(variants, warnings=args.lint_warnings)
+    template = VariantTemplate()
+    for v in passed:
+        template.write(v, _out_path(args.out_dir, v))
+    print("[OK] {} variants saved -> {}".format(len(passed), args.out_dir))
+    if len(passed) < len(variants):
+        raise SystemExit("[FAIL] {} variant(s) skipped".format(len(variants) - len(passed)))
+
+
+if __name__ == "__main__":
+    main()
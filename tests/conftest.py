@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The deck tools are top-level scripts; make them importable from tests/.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
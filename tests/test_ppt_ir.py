@@ -0,0 +1,67 @@
+import pytest
+
+pytest.importorskip("pptx")
+
+from lxml import etree
+
+import generate_ppt as gp
+from ppt_ir import KIND_TEXT, IRDeck, ShapeTable, record_deck
+
+
+def _xml(prs):
+    return [etree.tostring(slide._element) for slide in prs.slides]
+
+
+def test_materialised_deck_matches_direct_build():
+    assert _xml(record_deck().to_presentation()) == _xml(gp.build_presentation())
+
+
+def test_recolour_follows_fills_and_text_styles():
+    t = record_deck().table
+    blue = [r.fill for r in t.rows() if r.kind != KIND_TEXT and t.colors[r.fill] == gp.ELECTRIC_BLUE]
+    assert blue
+    t.recolour({gp.ELECTRIC_BLUE: gp.RED})
+    assert gp.ELECTRIC_BLUE not in t.colors.values
+    assert all(t.colors[f] == gp.RED for f in blue)
+    assert any(t.colors[t.styles[r.style].color] == gp.RED
+               for r in t.rows() if r.kind == KIND_TEXT)
+
+
+def test_recolouring_a_filtered_table_leaves_the_parent_alone():
+    t = record_deck().table
+    before = [t.colors[r.fill] for r in t.rows() if r.kind != KIND_TEXT]
+    texts = t.filter(kinds=[KIND_TEXT]).recolour({gp.ELECTRIC_BLUE: gp.RED})
+
+    assert [t.colors[r.fill] for r in t.rows() if r.kind != KIND_TEXT] == before
+    assert all(r.kind == KIND_TEXT for r in texts.rows())
+    assert gp.RED in [texts.colors[texts.styles[r.style].color] for r in texts.rows()]
+
+
+def test_filter_and_reflow_by_slide():
+    t = record_deck().table
+    second = t.filter(slides=[1])
+    assert len(second) == sum(1 for s in t.slide if s == 1)
+
+    x0 = list(t.x)
+    t.reflow(dx=100, scale=0.5, slides=[1])
+    for i, s in enumerate(t.slide):
+        assert t.x[i] == (int(x0[i] * 0.5) + 100 if s == 1 else x0[i])
+
+
+def test_extend_offsets_slides_and_requires_shared_interners():
+    deck = record_deck(gp.SLIDE_BUILDERS[:2])
+    n = len(deck.table)
+    part = IRDeck(table=ShapeTable(deck.table.colors, deck.table.strings,
+                                   deck.table.styles))
+    gp.slide_03_solution(part)
+    deck.table.extend(part.table, slide_offset=2)
+    assert len(deck.table) == n + len(part.table)
+    assert set(deck.table.slide) == {0, 1, 2}
+    with pytest.raises(ValueError):
+        deck.table.extend(record_deck(gp.SLIDE_BUILDERS[:1]).table)
+
+
+def test_rich_text_box_refuses_a_recorder():
+    slide = IRDeck().add_slide()
+    with pytest.raises(TypeError):
+        gp.add_rich_text_box(slide, 1, 1, 2, 1)
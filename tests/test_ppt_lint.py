@@ -0,0 +1,127 @@
+import random
+import time
+
+import pytest
+
+pytest.importorskip("pptx")
+
+from ppt_lint import (ERROR, KIND_CARD, KIND_RECT, KIND_TEXT, Box, lint_boxes,
+                      overlapping_pairs, report)
+from pptx.dml.color import RGBColor
+
+BG = RGBColor(15, 23, 42)
+WHITE = RGBColor(255, 255, 255)
+IN = 914400
+
+
+def _box(index, left, top, right, bottom, kind=KIND_RECT, text=""):
+    return Box(1, index, "s{}".format(index), kind, left, top, right, bottom,
+               text, 12700 * 12 if text else None, WHITE if text else None,
+               False, True, (0, 0, 0, 0))
+
+
+def _text(index, left, top, w, h, text="x"):
+    return _box(index, left * IN, top * IN, (left + w) * IN, (top + h) * IN,
+                KIND_TEXT, text)
+
+
+def _shape(index, left, top, w, h, kind=KIND_RECT):
+    return _box(index, left * IN, top * IN, (left + w) * IN, (top + h) * IN, kind)
+
+
+def _brute(boxes, tol):
+    out = set()
+    for i, a in enumerate(boxes):
+        for b in boxes[i + 1:]:
+            if (min(a.right, b.right) - max(a.left, b.left) > tol and
+                    min(a.bottom, b.bottom) - max(a.top, b.top) > tol):
+                out.add(frozenset((a.index, b.index)))
+    return out
+
+
+def _fast(boxes, tol):
+    return {frozenset((a.index, b.index)) for a, b in overlapping_pairs(boxes, tol)}
+
+
+@pytest.mark.parametrize("tol", [0, 1, 3, 10])
+def test_overlapping_pairs_matches_brute_force(tol):
+    rng = random.Random(tol)
+    for case in range(600):
+        boxes = []
+        for i in range(rng.randint(0, 25)):
+            x, y = rng.randint(0, 60), rng.randint(0, 60)
+            boxes.append(_box(i, x, y, x + rng.randint(0, 30), y + rng.randint(0, 30)))
+        assert _fast(boxes, tol) == _brute(boxes, tol), (case, boxes)
+
+
+def test_thin_box_inside_wider_box_respects_tolerance():
+    outer = _box(0, 0, 0, 27, 27)
+    thin = _box(1, 10, 0, 12, 27)
+    assert _fast([outer, thin], 3) == set()
+    assert _fast([outer, thin], 1) == {frozenset((0, 1))}
+
+
+def test_stacked_rows_scale_subquadratically():
+    def run(n):
+        rows = [_box(i, 0, i * 10, 10000, i * 10 + 10) for i in range(n)]
+        t0 = time.perf_counter()
+        assert list(overlapping_pairs(rows)) == []
+        return time.perf_counter() - t0
+
+    small, large = run(1000), run(8000)
+    assert large < small * 8 * 3
+
+
+def _errors(boxes):
+    return [i for i in lint_boxes(boxes, 13 * IN, 7 * IN, BG) if i.severity == ERROR]
+
+
+def test_duplicate_and_nested_text_boxes_are_errors():
+    assert len(_errors([_text(0, 1, 1, 3, 0.5), _text(1, 1, 1, 3, 0.5)])) == 1
+    assert len(_errors([_text(0, 1, 1, 5, 2), _text(1, 2, 1.5, 1, 0.5)])) == 1
+
+
+def test_overlapping_cards_are_errors():
+    assert len(_errors([_shape(0, 1, 1, 3, 3, KIND_CARD),
+                        _shape(1, 3, 1, 3, 3, KIND_CARD)])) == 1
+
+
+def test_intended_layering_is_not_reported():
+    card = _shape(0, 1, 1, 4, 4, KIND_CARD)
+    accent = _shape(1, 1, 1, 4, 0.08, KIND_RECT)
+    label = _text(2, 1.2, 1.5, 3, 0.5)
+    cell = _shape(3, 6, 1, 4, 1, KIND_RECT)
+    cell_label = _text(4, 6.2, 1.1, 3, 0.5)
+    assert _errors([card, accent, label, cell, cell_label]) == []
+
+
+def test_report_groups_repeated_warnings_and_hides_them_by_default(capsys):
+    footer = [_text(0, 8.5, 6.5, 4.5, 0.35, "footer")._replace(slide=n, color=RGBColor(100, 116, 139))
+              for n in (1, 2, 3)]
+    issues = lint_boxes(footer, 13 * IN, 7 * IN, BG)
+    assert report(issues) == 0
+    assert capsys.readouterr().out == ""
+    report(issues, warnings=True)
+    out = capsys.readouterr().out.splitlines()
+    assert len(out) == 1 and "slides 1,2,3" in out[0]
+
+
+def test_generated_deck_lints_clean():
+    from generate_ppt import BG_COLOR, build_presentation
+    from ppt_lint import lint_presentation
+
+    issues = lint_presentation(build_presentation(), BG_COLOR)
+    assert [i for i in issues if i.severity == ERROR] == []
+
+
+def test_linting_leaves_the_deck_unchanged():
+    from lxml import etree
+
+    from generate_ppt import BG_COLOR, build_presentation
+    from ppt_lint import lint_presentation
+
+    prs = build_presentation()
+    before = [etree.tostring(s._element) for s in prs.slides]
+    issues = lint_presentation(prs, BG_COLOR)
+    assert [etree.tostring(s._element) for s in prs.slides] == before
+    assert any(i.rule == "contrast" for i in issues)    # styles were still read
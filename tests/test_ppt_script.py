@@ -0,0 +1,81 @@
+import pytest
+
+pytest.importorskip("pptx")
+
+from ppt_script import ScriptCompiler, bullets, parse_sections, speaker_notes
+
+SCRIPT = """\
+# MailMind — Presentation Script
+
+## Slide 1: Title
+
+**Speaker:** Good morning, we are *Team Cipher*.
+
+## Slide 2: The Problem
+
+Intro
+
+```bash
+# run this
+npm test
+```
+More prose
+
+- Too many emails
+- No **priorities**
+
+## Slide 13: Extra
+
+### First point
+- Second point
+
+# Appendix
+
+## Q&A
+
+- Not a slide
+"""
+
+
+def _sections(text=SCRIPT):
+    return list(parse_sections(text.splitlines(True)))
+
+
+def test_sections_and_top_level_headings():
+    sections = _sections()
+    assert [(s.number, s.title) for s in sections] == [
+        (1, "Title"), (2, "The Problem"), (13, "Extra"), (None, "Q&A")]
+    assert "Not a slide" not in " ".join(sections[2].lines)
+
+
+def test_fenced_code_does_not_end_a_section():
+    problem = _sections()[1]
+    assert speaker_notes(problem.lines) == (
+        "Intro\n\n# run this\nnpm test\n\nMore prose\n\n- Too many emails - No priorities")
+    assert bullets(problem.lines) == ["Too many emails", "No priorities"]
+
+
+def test_notes_drop_markdown_emphasis():
+    assert speaker_notes(_sections()[0].lines) == \
+        "Speaker: Good morning, we are Team Cipher."
+
+
+def test_editing_one_section_only_recompiles_that_slide():
+    compiler = ScriptCompiler()
+    deck = compiler.compile(SCRIPT.splitlines(True))
+    n = deck.slide_count
+    assert (compiler.hits, compiler.misses) == (0, n)
+
+    compiler.hits = compiler.misses = 0
+    edited = SCRIPT.replace("Too many emails", "Far too many emails")
+    deck = compiler.compile(edited.splitlines(True))
+    assert (compiler.hits, compiler.misses) == (n - 1, 1)
+    assert deck.slide_count == n and len(compiler.cache) == n
+
+
+def test_appendix_sections_become_generic_slides():
+    compiler = ScriptCompiler(appendix=True)
+    deck = compiler.compile(SCRIPT.splitlines(True))
+    assert deck.slide_count == 4
+    texts = set(deck.table.strings.values)
+    assert {"Extra", "First point", "Second point", "Q&A", "Not a slide"} <= texts
@@ -0,0 +1,44 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+
+pytest.importorskip("pptx")
+
+import generate_ppt as gp
+from ppt_ir import KIND_TEXT, IRDeck, record_deck
+from ppt_svg import export_svg, slide_svgs
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def test_one_svg_per_slide_with_every_recorded_shape():
+    deck = record_deck()
+    svgs = slide_svgs(deck)
+    assert len(svgs) == len(gp.SLIDE_BUILDERS)
+
+    rows = list(deck.table.rows())
+    for n, svg in enumerate(svgs):
+        root = ET.fromstring(svg)
+        on_slide = [r for r in rows if r.slide == n]
+        assert len(root.findall(SVG + "text")) == sum(r.kind == KIND_TEXT for r in on_slide)
+        assert len(root.findall(SVG + "rect")) == sum(r.kind != KIND_TEXT for r in on_slide)
+
+
+def test_text_is_escaped_and_wrapped():
+    deck = IRDeck()
+    slide = gp.new_slide(deck)
+    gp.add_text_box(slide, 1, 1, 2, 2, "R&D <team> " + "word " * 20)
+    root = ET.fromstring(slide_svgs(deck)[0])
+
+    text = [t for t in root.iter(SVG + "text") if "R&D" in "".join(t.itertext())][0]
+    lines = text.findall(SVG + "tspan")
+    assert len(lines) > 1
+    assert lines[0].text.startswith("R&D <team>")
+
+
+def test_export_writes_slides_and_index(tmp_path):
+    svgs = export_svg(str(tmp_path))
+    names = sorted(p.name for p in tmp_path.iterdir())
+    assert names == ["index.html"] + ["slide_{:02d}.svg".format(n)
+                                      for n in range(1, len(svgs) + 1)]
+    assert (tmp_path / "index.html").read_text(encoding="utf-8").count("<svg") == len(svgs)
@@ -0,0 +1,93 @@
+import json
+import os
+import threading
+from collections import Counter, defaultdict
+
+import pytest
+
+pytest.importorskip("pptx")
+
+import generate_ppt as gp
+from ppt_trace import traced_generate
+
+
+def _spans(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _check_trace(spans, out_path):
+    ids = {s["span_id"] for s in spans}
+    assert len(ids) == len(spans)
+    roots = [s for s in spans if s["parent_id"] is None]
+    assert [r["name"] for r in roots] == ["generate"]
+    assert all(s["parent_id"] in ids for s in spans if s is not roots[0])
+
+    builders = [s for s in spans if s["name"].startswith("slide_")]
+    assert [b["name"] for b in builders] == [b.__name__ for b in gp.SLIDE_BUILDERS]
+    assert all(b["parent_id"] == roots[0]["span_id"] and b["shapes"] > 0
+               for b in builders)
+    saves = [s for s in spans if s["name"] == "prs.save"]
+    assert len(saves) == 1 and saves[0]["bytes"] == os.path.getsize(out_path)
+
+
+def test_concurrent_traced_builds_keep_their_spans_apart(tmp_path, capsys):
+    helpers = {name: getattr(gp, name) for name in dir(gp) if name.startswith("add_")}
+    trace = str(tmp_path / "build.jsonl")
+
+    traced_generate(gp, str(tmp_path / "serial.jsonl"), lint=False,
+                    out_path=str(tmp_path / "serial.pptx"))
+    expected = Counter(s["name"] for s in _spans(str(tmp_path / "serial.jsonl")))
+
+    ids, errors = {}, []
+
+    def run(n):
+        try:
+            out = str(tmp_path / "deck_{}.pptx".format(n))
+            ids[traced_generate(gp, trace, lint=False, out_path=out).trace_id] = out
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=run, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+
+    by_trace = defaultdict(list)
+    for span in _spans(trace):
+        by_trace[span["trace_id"]].append(span)
+    assert set(by_trace) == set(ids)
+    for trace_id, spans in by_trace.items():
+        assert Counter(s["name"] for s in spans) == expected
+        _check_trace(spans, ids[trace_id])
+
+    # nothing is patched, so an untraced build afterwards records nothing
+    assert helpers == {name: getattr(gp, name) for name in helpers}
+    gp.generate(lint=False, out_path=str(tmp_path / "plain.pptx"))
+    assert len(_spans(trace)) == sum(expected.values()) * 4
+
+
+def test_unsampled_build_writes_no_spans(tmp_path, capsys):
+    trace = str(tmp_path / "build.json")
+    tracer = traced_generate(gp, trace, sample_rate=0.0, lint=False,
+                             out_path=str(tmp_path / "deck.pptx"))
+    assert not tracer.sampled
+    assert not os.path.exists(trace)
+
+
+def test_recording_shapes_into_the_ir_skips_the_tracer(monkeypatch):
+    import ppt_trace
+    from ppt_ir import record_deck
+
+    lookups = []
+
+    class Counting(object):
+        def get(self):
+            lookups.append(1)
+
+    monkeypatch.setattr(ppt_trace, "_active", Counting())
+    deck = record_deck()
+    assert len(deck.table) > 10 * deck.slide_count
+    assert len(lookups) <= 2 * deck.slide_count      # new_slide, add_slide_title